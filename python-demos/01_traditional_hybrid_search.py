@@ -67,10 +67,22 @@ def create_search_client():
     except Exception as e:
         raise Exception(f"Error creating search client: {e}")
 
-async def llm_category_mapping(query):
+def usage_to_dict(usage):
+    """Convert an OpenAI completion usage object into plain token counts"""
+    if not usage:
+        return {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+    return {
+        "prompt_tokens": usage.prompt_tokens,
+        "completion_tokens": usage.completion_tokens,
+        "total_tokens": usage.total_tokens
+    }
+
+async def llm_category_mapping(query, token_usage=None):
     """
     LLM-powered category inference - more intelligent than manual keyword mapping
     Still shows traditional approach limitations vs agentic search
+    
+    Token counts for the categorization call are recorded in token_usage when provided
     """
     try:
         await cl.Message(content="   🤖 Using LLM for category detection...").send()
@@ -98,7 +110,8 @@ async def llm_category_mapping(query):
         
         user_query = f"Categorize this search query: {query}"
         
-        completion = openai_client.chat.completions.create(
+        # Run the blocking SDK call in a worker thread so concurrent pipelines are not stalled
+        completion = await cl.make_async(openai_client.chat.completions.create)(
             model=OPENAI_DEPLOYMENT,
             max_tokens=800,
             temperature=0.3,  # Lower temperature for more consistent categorization
@@ -114,6 +127,9 @@ async def llm_category_mapping(query):
             response_format={"type": "json_object"}
         )
         
+        if token_usage is not None:
+            token_usage["categorization"] = usage_to_dict(completion.usage)
+        
         json_string = completion.choices[0].message.content
         data = json.loads(json_string)
         categories = data.get("categories", ["Miscellaneous"])
@@ -164,7 +180,7 @@ def build_filter_expression(categories):
     category_filters = [f"category/any(c: c eq '{cat}')" for cat in categories]
     return " or ".join(category_filters)
 
-async def generate_natural_language_answer(query, documents):
+async def generate_natural_language_answer(query, documents, token_usage=None):
     """
     Generate a comprehensive natural language answer using Azure OpenAI
     based on the traditional search results
@@ -172,6 +188,7 @@ async def generate_natural_language_answer(query, documents):
     Args:
         query (str): The original user query
         documents (list): List of search result documents
+        token_usage (dict): Optional dict that receives the answer generation token counts
     
     Returns:
         str: Natural language answer or None if generation fails
@@ -226,7 +243,7 @@ async def generate_natural_language_answer(query, documents):
         """
         
         # Generate natural language response
-        completion = openai_client.chat.completions.create(
+        completion = await cl.make_async(openai_client.chat.completions.create)(
             model=OPENAI_DEPLOYMENT,
             max_tokens=1500,  # Allow for comprehensive responses
             temperature=0.3,  # Lower temperature for more focused, factual responses
@@ -236,6 +253,9 @@ async def generate_natural_language_answer(query, documents):
             ]
         )
         
+        if token_usage is not None:
+            token_usage["answer_generation"] = usage_to_dict(completion.usage)
+        
         natural_answer = completion.choices[0].message.content
         await cl.Message(content=f"   ✅ Generated natural language answer ({len(natural_answer)} characters)").send()
         
@@ -254,11 +274,15 @@ async def traditional_hybrid_search(query):
     await cl.Message(content=f"Query: {query}").send()
     
     start_time = time.time()
+    stage_timings = {}
+    token_usage = {}
     
     try:        
         # Step 1: LLM-powered category inference (still traditional approach)
         await cl.Message(content="\n1. LLM-powered category detection...").send()
-        categories = await llm_category_mapping(query)
+        stage_start = time.time()
+        categories = await llm_category_mapping(query, token_usage)
+        stage_timings["categorization"] = (time.time() - stage_start) * 1000
         await cl.Message(content=f"   Detected categories: {categories}").send()
         
         # Step 2: Manual filter construction
@@ -284,7 +308,12 @@ async def traditional_hybrid_search(query):
             search_options["filter"] = filter_expr
         
         # Single query execution - no parallel processing
-        results = search_client.search(search_text=query, **search_options)
+        # Results are paged lazily, so materialize them inside the worker thread
+        stage_start = time.time()
+        results = await cl.make_async(
+            lambda: list(search_client.search(search_text=query, **search_options))
+        )()
+        stage_timings["search"] = (time.time() - stage_start) * 1000
         
         # Step 5: Process results manually
         await cl.Message(content="\n4. Processing results...").send()
@@ -306,7 +335,9 @@ async def traditional_hybrid_search(query):
         # Step 6: Generate natural language answer
         natural_answer = None
         if documents:
-            natural_answer = await generate_natural_language_answer(query, documents)
+            stage_start = time.time()
+            natural_answer = await generate_natural_language_answer(query, documents, token_usage)
+            stage_timings["answer_generation"] = (time.time() - stage_start) * 1000
         
         # Display results
         results_content = f"""
@@ -355,7 +386,9 @@ async def traditional_hybrid_search(query):
             "result_count": total_count,
             "categories_used": categories,
             "search_type": "traditional_hybrid",
-            "natural_answer": natural_answer
+            "natural_answer": natural_answer,
+            "stage_timings_ms": stage_timings,
+            "token_usage": token_usage
         }
         
     except Exception as e:
@@ -47,6 +47,29 @@ AZURE_OPENAI_MODEL = os.getenv("AZURE_OPENAI_MODEL")
 AZURE_OPENAI_API_VERSION = os.getenv("AZURE_OPENAI_API_VERSION")
 AZURE_OPENAI_API_KEY = os.getenv("AZURE_OPENAI_API_KEY")
 
+def usage_to_dict(usage):
+    if not usage:
+        return {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+    return {
+        "prompt_tokens": usage.prompt_tokens,
+        "completion_tokens": usage.completion_tokens,
+        "total_tokens": usage.total_tokens
+    }
+
+def activity_token_usage(activities):
+    # Query planning and answer synthesis activities report the tokens the agent spent
+    prompt_tokens = 0
+    completion_tokens = 0
+    for activity in activities:
+        activity_dict = activity.as_dict()
+        prompt_tokens += activity_dict.get("input_tokens") or 0
+        completion_tokens += activity_dict.get("output_tokens") or 0
+    return {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens
+    }
+
 async def create_knowledge_agent():
     await cl.Message(content="\n1. Setting up knowledge agent...").send()
     try:
@@ -69,7 +92,7 @@ async def create_knowledge_agent():
                 )
             ]
         )
-        index_client.create_or_update_agent(agent)
+        await cl.make_async(index_client.create_or_update_agent)(agent)
         await cl.Message(content=f"   ✅ Knowledge agent '{AGENT_NAME}' created or updated successfully").send()
         return True
     except Exception as e:
@@ -80,9 +103,13 @@ async def agentic_retrieval_search(query):
     await cl.Message(content=f"\n=== Agentic Search Demo ===").send()
     await cl.Message(content=f"Query: {query}").send()
     start_time = time.time()
+    stage_timings = {}
+    token_usage = {}
     try:
         # Step 1: Setup knowledge agent
+        stage_start = time.time()
         agent_ok = await create_knowledge_agent()
+        stage_timings["agent_setup"] = (time.time() - stage_start) * 1000
         if not agent_ok:
             return None
         # Step 2: Create agent client for retrieval
@@ -106,7 +133,9 @@ async def agentic_retrieval_search(query):
         # Step 4: Execute agentic retrieval using the SDK
         await cl.Message(content="\n4. Executing agentic retrieval...").send()
         await cl.Message(content="   🤖 LLM analyzing query and planning subqueries...").send()
-        retrieval_result = agent_client.retrieve(
+        # Run the blocking SDK call in a worker thread so concurrent pipelines are not stalled
+        stage_start = time.time()
+        retrieval_result = await cl.make_async(agent_client.retrieve)(
             retrieval_request=KnowledgeAgentRetrievalRequest(
                 messages=[
                     KnowledgeAgentMessage(
@@ -122,6 +151,7 @@ async def agentic_retrieval_search(query):
                 ]
             )
         )
+        stage_timings["retrieval"] = (time.time() - stage_start) * 1000
         end_time = time.time()
         execution_time = (end_time - start_time) * 1000
         # Step 5: Process and display results
@@ -129,6 +159,7 @@ async def agentic_retrieval_search(query):
         unified_result = retrieval_result.response[0].content[0].text if retrieval_result.response else ""
         references = retrieval_result.references or []
         activities = retrieval_result.activity or []
+        token_usage["retrieval"] = activity_token_usage(activities)
         # Show LLM's query breakdown and execution plan
         if activities:
             plan_content = f"\n🧠 LLM Query Breakdown & Execution Plan:"
@@ -151,7 +182,9 @@ async def agentic_retrieval_search(query):
             top_refs_content += f"\n{i}. Document: {doc_key}\n   Activity Source: {activity_source}\n   Reference ID: {ref_dict.get('id', 'N/A')}\n"
         await cl.Message(content=top_refs_content).send()
         # Generate natural language answer
-        natural_answer = await generate_natural_language_answer(query, retrieval_result)
+        stage_start = time.time()
+        natural_answer = await generate_natural_language_answer(query, retrieval_result, token_usage)
+        stage_timings["answer_generation"] = (time.time() - stage_start) * 1000
         # Highlight agentic advantages
         advantages_content = """
 ## Agentic Search Advantages Demonstrated
@@ -172,13 +205,15 @@ async def agentic_retrieval_search(query):
             "search_type": "agentic_retrieval",
             "activities": [activity.as_dict() for activity in activities],
             "unified_result": unified_result,
-            "natural_answer": natural_answer
+            "natural_answer": natural_answer,
+            "stage_timings_ms": stage_timings,
+            "token_usage": token_usage
         }
     except Exception as e:
         await cl.Message(content=f"Error in agentic search: {e}").send()
         return None
 
-async def generate_natural_language_answer(query, retrieval_result):
+async def generate_natural_language_answer(query, retrieval_result, token_usage=None):
     await cl.Message(content=f"\n6. Generating natural language answer...").send()
     try:
         client = AzureOpenAI(
@@ -213,12 +248,14 @@ async def generate_natural_language_answer(query, retrieval_result):
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_prompt}
         ]
-        response = client.chat.completions.create(
+        response = await cl.make_async(client.chat.completions.create)(
             model=AZURE_OPENAI_MODEL,
             messages=messages,
             temperature=0.3,
             max_tokens=3000
         )
+        if token_usage is not None:
+            token_usage["answer_generation"] = usage_to_dict(response.usage)
         answer = response.choices[0].message.content
         await cl.Message(content=f"   ✅ Generated natural language answer ({len(answer)} characters)").send()
         answer_content = f"""
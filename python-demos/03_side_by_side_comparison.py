@@ -0,0 +1,139 @@
+"""
+Side-by-Side Comparison Demo
+Runs the traditional hybrid search and agentic retrieval pipelines concurrently for the same query
+
+This script shows both approaches under identical conditions:
+1. Dispatches both pipelines at the same time with asyncio.gather
+2. Renders each pipeline's progress and results in its own step as they complete
+3. Emits a per-stage latency and token usage comparison table
+4. Total comparison time is the slower pipeline rather than the sum of both
+"""
+
+import asyncio
+import importlib
+import time
+import chainlit as cl
+
+# The demo scripts start with digits, so they cannot be imported with a plain import statement
+# Their on_message handlers are replaced by the one registered at the bottom of this script
+traditional_demo = importlib.import_module("01_traditional_hybrid_search")
+agentic_demo = importlib.import_module("02_agentic_search")
+
+TRADITIONAL_STAGES = ["categorization", "search", "answer_generation"]
+AGENTIC_STAGES = ["agent_setup", "retrieval", "answer_generation"]
+
+async def run_pipeline(name, search_function, query):
+    """
+    Run a single pipeline inside its own step and report as soon as it completes
+    Returns the pipeline result together with its end-to-end elapsed time in milliseconds
+    """
+    start_time = time.time()
+    async with cl.Step(name=name):
+        result = await search_function(query)
+    elapsed_time = (time.time() - start_time) * 1000
+    if result:
+        await cl.Message(content=f"✅ {name} completed in **{elapsed_time:.2f} ms**").send()
+    else:
+        await cl.Message(content=f"❌ {name} failed after {elapsed_time:.2f} ms").send()
+    return result, elapsed_time
+
+def format_stage_cell(result, stage):
+    """Format the latency and token columns for one pipeline stage"""
+    if not result or stage not in result["stage_timings_ms"]:
+        return "-", "-"
+    latency = f"{result['stage_timings_ms'][stage]:.2f}"
+    usage = result["token_usage"].get(stage)
+    tokens = f"{usage['total_tokens']} ({usage['prompt_tokens']} in / {usage['completion_tokens']} out)" if usage else "-"
+    return latency, tokens
+
+def format_timed_stages(result):
+    """Format the summed latency of the timed stages for one pipeline"""
+    if not result:
+        return "-"
+    return f"{sum(result['stage_timings_ms'].values()):.2f}"
+
+def format_totals(result, elapsed_time):
+    """Format the end-to-end latency and total token columns for one pipeline"""
+    latency = f"**{elapsed_time:.2f}**"
+    if not result:
+        return latency, "-"
+    tokens = f"**{sum(usage['total_tokens'] for usage in result['token_usage'].values())}**"
+    return latency, tokens
+
+def build_comparison_table(traditional_result, traditional_time, agentic_result, agentic_time):
+    """Build a markdown table comparing per-stage latency and token usage"""
+    table = "| Stage | Traditional (ms) | Traditional tokens | Agentic (ms) | Agentic tokens |\n"
+    table += "|---|---|---|---|---|\n"
+
+    # Show each pipeline's own stages, aligning the stages both pipelines share
+    stages = TRADITIONAL_STAGES + [stage for stage in AGENTIC_STAGES if stage not in TRADITIONAL_STAGES]
+    for stage in stages:
+        traditional_latency, traditional_tokens = format_stage_cell(traditional_result, stage)
+        agentic_latency, agentic_tokens = format_stage_cell(agentic_result, stage)
+        table += f"| {stage.replace('_', ' ').title()} | {traditional_latency} | {traditional_tokens} | {agentic_latency} | {agentic_tokens} |\n"
+
+    # Timed stages exclude client setup, result rendering and message sends, so the total uses elapsed time
+    table += f"| Timed stages | {format_timed_stages(traditional_result)} | - | {format_timed_stages(agentic_result)} | - |\n"
+
+    traditional_latency, traditional_tokens = format_totals(traditional_result, traditional_time)
+    agentic_latency, agentic_tokens = format_totals(agentic_result, agentic_time)
+    table += f"| **Total** | {traditional_latency} | {traditional_tokens} | {agentic_latency} | {agentic_tokens} |\n"
+    return table
+
+async def side_by_side_search(query):
+    """
+    Run both pipelines concurrently for the same query
+    Both share the same network conditions and the comparison costs only the slower pipeline
+    """
+    await cl.Message(content=f"\n=== Side-by-Side Comparison Demo ===").send()
+    await cl.Message(content=f"Query: {query}").send()
+
+    start_time = time.time()
+    (traditional_result, traditional_time), (agentic_result, agentic_time) = await asyncio.gather(
+        run_pipeline("Traditional Hybrid Search", traditional_demo.traditional_hybrid_search, query),
+        run_pipeline("Agentic Search", agentic_demo.agentic_retrieval_search, query)
+    )
+    wall_clock_time = (time.time() - start_time) * 1000
+    sequential_time = traditional_time + agentic_time
+
+    comparison_content = f"""
+## Latency & Token Comparison
+
+{build_comparison_table(traditional_result, traditional_time, agentic_result, agentic_time)}
+
+**Wall-clock time (concurrent):** {wall_clock_time:.2f} ms  
+**Sequential time (sum of both pipelines):** {sequential_time:.2f} ms
+    """
+    await cl.Message(content=comparison_content).send()
+
+    return {
+        "wall_clock_time_ms": wall_clock_time,
+        "sequential_time_ms": sequential_time,
+        "traditional_time_ms": traditional_time,
+        "agentic_time_ms": agentic_time,
+        "traditional": traditional_result,
+        "agentic": agentic_result
+    }
+
+@cl.on_message
+async def main(message: cl.Message):
+    """Main Chainlit message handler that runs both pipelines for each user query"""
+    user_query = message.content
+
+    if not cl.user_session.get("initialized"):
+        welcome_content = """
+# Side-by-Side Comparison Demo
+
+Welcome! This demo runs traditional hybrid search and agentic search concurrently for the same question.
+
+Ask me any Azure architecture question to compare both approaches side by side!
+
+Examples:
+- "What are the networking requirements for AKS?"
+- "How do I configure security for Azure containers?"
+- "What are the best practices for Azure storage?"
+        """
+        await cl.Message(content=welcome_content).send()
+        cl.user_session.set("initialized", True)
+
+    await side_by_side_search(user_query)